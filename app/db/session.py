@@ -11,6 +11,9 @@ from config import settings
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
+    pool_use_lifo=True,  # reuse the most recently returned (warm) connection
+    pool_pre_ping=True,  # transparently replace stale connections on checkout
+    pool_recycle=3600,  # recycle connections older than an hour
 )
 
 # Create sessionmaker with the configured engine
@@ -1,5 +1,7 @@
 from typing import List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote
 
 import sys
@@ -9,9 +11,48 @@ sys.path.append(str(root))
 
 from config import settings
 
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After but never waits longer than MAX_RETRY_AFTER seconds."""
+
+    MAX_RETRY_AFTER = 30
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
 class JinaExtractor:
+
+    # Shared across instances so every extractor reuses pooled keep-alive connections
+    _session = None
+
+    # (connect, read) seconds; calls run on the Scrapy reactor thread so must be bounded
+    REQUEST_TIMEOUT = (5, 60)
+
     def __init__(self):
         self.url_prefix = 'https://r.jina.ai/'
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create pooled HTTP session, reusing the shared one if present."""
+        if JinaExtractor._session is None:
+            session = requests.Session()
+            # Short exponential backoff with jitter on 429/5xx, honouring a capped
+            # Retry-After, so a rate-limited page can't freeze the crawl for minutes
+            retry = _CappedRetry(
+                total=3,
+                backoff_factor=0.5,
+                backoff_jitter=0.5,
+                backoff_max=_CappedRetry.MAX_RETRY_AFTER,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({"GET", "POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+            JinaExtractor._session = session
+        return JinaExtractor._session
         
     def jina_reader_html2md(self,url:str) -> str:
         headers = {
@@ -24,7 +65,8 @@ class JinaExtractor:
             "url": url
         }
 
-        response = requests.post(self.url_prefix, headers=headers, json=data)
+        response = self.session.post(self.url_prefix, headers=headers, json=data,
+                                     timeout=self.REQUEST_TIMEOUT)
         return response.text
 
     def jina_search(self, query:str, restricted_urls:List[str]=None) -> str:
@@ -37,7 +79,7 @@ class JinaExtractor:
             'X-Site': restricted_urls
         }
 
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
 
         return response.text
 
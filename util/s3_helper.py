@@ -1,13 +1,17 @@
+import asyncio
 import hashlib
 import mimetypes
+import os
+from functools import lru_cache
 import boto3
 import aioboto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Dict, Any, Optional, BinaryIO, Union, List
+from typing import Dict, Any, Optional, BinaryIO, Union, List, Tuple
 from io import BytesIO
 import logging
 import sys
-from tqdm import tqdm
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
@@ -15,6 +19,58 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Larger pool and keep-alive so concurrent transfers don't queue for connections
+_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60
+)
+
+# Bigger parts, more parallel parts and 1 MB socket reads to fill high-latency links
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    io_chunksize=1024 * 1024,
+    use_threads=True
+)
+
+mimetypes.add_type('text/markdown', '.md')
+mimetypes.add_type('text/markdown', '.markdown')
+
+@lru_cache(maxsize=256)
+def _guess_ct(ext: str) -> Optional[str]:
+    """Guess content type from a file's full suffix chain (e.g. '.tar.gz'), memoized."""
+    return mimetypes.guess_type('x' + ext)[0]
+
+def _prepare_upload(
+    file_obj: Union[BinaryIO, BytesIO],
+    path: str,
+    metadata: Optional[Dict[str, str]],
+    content_type: Optional[str]
+) -> Tuple[Dict[str, Any], str]:
+    """Build upload ExtraArgs and compute the SHA-256 checksum of file_obj."""
+    # Prepare upload parameters
+    params = {}
+    if metadata:
+        params['Metadata'] = metadata
+    
+    if content_type:
+        params['ContentType'] = content_type
+    else:
+        content_type = _guess_ct(''.join(Path(path).suffixes))
+        if content_type:
+            params['ContentType'] = content_type
+    
+    # Calculate checksum
+    file_obj.seek(0)
+    checksum = hashlib.sha256(file_obj.read()).hexdigest()
+    file_obj.seek(0)
+
+    return params, checksum
+
 class S3Helper:
     """
     Enhanced S3/MinIO helper with comprehensive content management capabilities.
@@ -26,6 +82,10 @@ class S3Helper:
     - Content verification
     - Temporary URL generation
     """
+
+    # boto3 low-level clients are thread-safe, so one client (and its
+    # connection pool) is shared by every helper instance.
+    _client = None
     
     def __init__(self, **kwargs):
         """
@@ -39,13 +99,16 @@ class S3Helper:
         self.client = self._create_client()
     
     def _create_client(self):
-        """Create and configure S3 client."""
-        return boto3.client(
-            's3',
-            endpoint_url=settings.AWS_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-        )
+        """Create and configure S3 client, reusing the shared one if present."""
+        if S3Helper._client is None:
+            S3Helper._client = boto3.client(
+                's3',
+                endpoint_url=settings.AWS_ENDPOINT_URL,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                config=_CLIENT_CONFIG
+            )
+        return S3Helper._client
     
     def verify_bucket_exists(self):
         """Create bucket if it doesn't exist."""
@@ -64,30 +127,14 @@ class S3Helper:
         content_type: Optional[str] = None
     ) -> Dict[str, Any]:
         """Synchronously upload file to MinIO with metadata."""
-        # Prepare upload parameters
-        params = {}
-        if metadata:
-            params['Metadata'] = metadata
-        
-        if content_type:
-            params['ContentType'] = content_type
-        else:
-            mimetypes.add_type('text/markdown', '.md')
-            mimetypes.add_type('text/markdown', '.markdown')
-            content_type = mimetypes.guess_type(path)[0]
-            if content_type:
-                params['ContentType'] = content_type
-        
-        # Calculate checksum
-        file_obj.seek(0)
-        checksum = hashlib.sha256(file_obj.read()).hexdigest()
-        file_obj.seek(0)
+        params, checksum = _prepare_upload(file_obj, path, metadata, content_type)
         
         # Upload file
         self.client.upload_fileobj(file_obj,
                                    settings.AWS_BUCKET_NAME,
                                    path,
-                                   ExtraArgs=params)
+                                   ExtraArgs=params,
+                                   Config=_TRANSFER_CONFIG)
         
         return {
             'path': path,
@@ -95,4 +142,124 @@ class S3Helper:
             'content_type': params.get('ContentType'),
             'metadata': metadata
         }
-    
\ No newline at end of file
+
+
+class AsyncS3Helper:
+    """
+    Asynchronous S3/MinIO helper built on aioboto3.
+
+    Suited to fanning out many independent uploads on a single event loop
+    rather than one thread per transfer. One client (and its connection
+    pool) is kept open for the helper's lifetime; use it as an async
+    context manager or call close() when done.
+    """
+
+    # Each upload can use max_concurrency connections for its parts, so cap
+    # concurrent uploads to keep the total within the client's connection pool
+    MAX_CONCURRENT_UPLOADS = max(
+        1, _CLIENT_CONFIG.max_pool_connections // _TRANSFER_CONFIG.max_concurrency
+    )
+
+    def __init__(self, **kwargs):
+        """
+        Initialize async S3 helper.
+
+        Args:
+            **kwargs: Override default settings from config
+        """
+        self.session = aioboto3.Session()
+        self._client_cm = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self._upload_slots = asyncio.Semaphore(self.MAX_CONCURRENT_UPLOADS)
+
+    async def __aenter__(self) -> "AsyncS3Helper":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _open_client(self):
+        """Create an async S3 client context manager."""
+        return self.session.client(
+            's3',
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=_CLIENT_CONFIG
+        )
+
+    async def _get_client(self):
+        """Return the long-lived client, opening it on first use."""
+        async with self._client_lock:
+            if self._client is None:
+                self._client_cm = self._open_client()
+                self._client = await self._client_cm.__aenter__()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the long-lived client and release its connections."""
+        async with self._client_lock:
+            if self._client is not None:
+                client_cm = self._client_cm
+                self._client_cm = None
+                self._client = None
+                await client_cm.__aexit__(None, None, None)
+
+    async def _upload(
+        self,
+        file_obj: Union[BinaryIO, BytesIO],
+        path: str,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Upload a single file using the shared client."""
+        client = await self._get_client()
+
+        # Held across read, hash and transfer so at most MAX_CONCURRENT_UPLOADS
+        # files are buffered in memory at once
+        async with self._upload_slots:
+            # Reading and hashing large files would otherwise block the event loop
+            params, checksum = await asyncio.to_thread(
+                _prepare_upload, file_obj, path, metadata, content_type
+            )
+
+            await client.upload_fileobj(file_obj,
+                                        settings.AWS_BUCKET_NAME,
+                                        path,
+                                        ExtraArgs=params,
+                                        Config=_TRANSFER_CONFIG)
+
+        return {
+            'path': path,
+            'checksum': checksum,
+            'content_type': params.get('ContentType'),
+            'metadata': metadata
+        }
+
+    async def upload_file(
+        self,
+        file_obj: Union[BinaryIO, BytesIO],
+        path: str,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Asynchronously upload file to MinIO with metadata."""
+        return await self._upload(file_obj, path, metadata, content_type)
+
+    async def upload_many(self, files: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Concurrently upload several files over the shared client, at most
+        MAX_CONCURRENT_UPLOADS at a time.
+
+        Args:
+            files: List of keyword-argument dicts accepted by upload_file
+
+        Returns:
+            List of upload results, or the raised exception for failed uploads
+        """
+        return await asyncio.gather(
+            *(self._upload(**f) for f in files),
+            return_exceptions=True
+        )
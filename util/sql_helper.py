@@ -1,9 +1,11 @@
 from datetime import datetime
 
-from app.db.session import get_db
+from sqlalchemy import inspect
+
+from app.db.session import get_db, engine
 from app.models.scraper import Scrapy
 from app.db.base import import_models
-from config import logger,settings
+from config import logger
 from util.s3_helper import S3Helper
 
 
@@ -32,9 +34,6 @@ class SQLHelper:
     
     def create_table(self):
 
-        from sqlalchemy import create_engine, inspect
-        
-        engine = create_engine(settings.DATABASE_URL)
         inspector = inspect(engine)
 
         if not inspector.has_table(Scrapy.__tablename__):